@@ -1,7 +1,47 @@
 # -*- coding: utf-8 -*-
 
+import bisect
+import collections
+import functools
+import hashlib
+import itertools
 import json
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import asyncio
+    import aiohttp
+except ImportError:  # optional: without aiohttp the analyse calls use httpx or requests
+    aiohttp = None
+
+try:
+    import httpx
+    import h2  # noqa: F401  (needed by httpx for HTTP/2)
+except ImportError:  # optional: HTTP/2 multiplexed transport when aiohttp is missing
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding/decoding, stdlib json otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: without ijson requests-based analyse responses are parsed whole
+    ijson = None
+
+try:
+    import brotli  # noqa: F401  (lets urllib3/aiohttp/httpx decode br responses)
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip"
 
 from qgis.PyQt.QtCore import QCoreApplication, QDate, QVariant
 from qgis.core import (
@@ -15,7 +55,6 @@ from qgis.core import (
     QgsProcessingException,
     QgsCoordinateReferenceSystem,
     QgsCoordinateTransform,
-    QgsProject,
     QgsWkbTypes,
     QgsGeometry,
     QgsFields,
@@ -25,6 +64,199 @@ from qgis.core import (
 )
 
 
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _transform_context_key(transform_context):
+    """Hashable fingerprint of the datum transformations chosen in a transform context."""
+    return tuple(sorted(transform_context.coordinateOperations().items()))
+
+
+# (source CRS, destination authid, transform context fingerprint) -> QgsCoordinateTransform
+_transform_cache = {}
+_TRANSFORM_CACHE_SIZE = 128
+
+
+def _get_transform(src_definition, dst_authid, transform_context, context_key):
+    # src_definition is an authid, or the WKT for custom CRSs without one. context_key is part
+    # of the key so that a different project or datum transformation choice builds a new pipeline.
+    key = (src_definition, dst_authid, context_key)
+    transform = _transform_cache.get(key)
+    if transform is not None:
+        return transform
+
+    src_crs = QgsCoordinateReferenceSystem()
+    src_crs.createFromUserInput(src_definition)
+    transform = QgsCoordinateTransform(
+        src_crs,
+        QgsCoordinateReferenceSystem(dst_authid),
+        transform_context
+    )
+
+    if len(_transform_cache) >= _TRANSFORM_CACHE_SIZE:
+        del _transform_cache[next(iter(_transform_cache))]  # oldest first
+    _transform_cache[key] = transform
+    return transform
+
+
+# GET + query string is the documented analyse contract. Only queries longer than this
+# (detailed polygons, risking 414 URI Too Long) are sent as a JSON POST body instead.
+_MAX_QUERY_LENGTH = 8000
+
+# Analyse URLs that rejected a POST: always use GET for them
+_post_unsupported = set()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _use_post(url, params):
+    return url not in _post_unsupported and len(urllib.parse.urlencode(params)) > _MAX_QUERY_LENGTH
+
+
+def _post_rejected(status):
+    # Any client error but rate limiting means the endpoint does not take this POST: retry as GET
+    return 400 <= status < 500 and status != 429
+
+
+def _analyse_body(params):
+    # params values are already JSON (timestampIds, geometry): splice them instead of re-encoding
+    return (
+        f'{{"timestampIds":{params["timestampIds"]},'
+        f'"geometry":{params["geometry"]},'
+        f'"returnType":"{params["returnType"]}"}}'
+    )
+
+
+# Retry policy shared by all transports (urllib3 Retry for requests, explicit loops otherwise)
+_RETRY_STATUSES = (429, 502, 503, 504)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.5
+
+
+def _retry_delay(attempt, retry_after):
+    """Seconds to wait before retry number `attempt` (0-based), honouring a numeric Retry-After."""
+    try:
+        return min(float(retry_after), 60.0)
+    except (TypeError, ValueError):
+        return _RETRY_BACKOFF * (2 ** attempt)
+
+
+def _analyse_error(status, text):
+    if status is None:  # no HTTP response: connection error or timeout
+        return QgsProcessingException(f"Errore analyse: {(text or '')[:200]}")
+    return QgsProcessingException(f"Errore analyse (HTTP {status}): {(text or '')[:200]}")
+
+
+async def _analyse_one(session, url, params):
+    try:
+        if _use_post(url, params):
+            async with session.post(url, data=_analyse_body(params), headers=_JSON_HEADERS) as r:
+                if r.status == 200:
+                    return _json_loads(await r.read())
+                if not _post_rejected(r.status):
+                    raise _analyse_error(r.status, await r.text())
+                _post_unsupported.add(url)
+
+        for attempt in range(_RETRY_TOTAL + 1):
+            async with session.get(url, params=params) as r:
+                if r.status == 200:
+                    return _json_loads(await r.read())
+                if r.status not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                    raise _analyse_error(r.status, await r.text())
+                delay = _retry_delay(attempt, r.headers.get("Retry-After"))
+            await asyncio.sleep(delay)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        raise _analyse_error(None, str(e) or type(e).__name__) from e
+
+
+async def _analyse_all(url, params_list, max_concurrent):
+    connector = aiohttp.TCPConnector(limit_per_host=max_concurrent)
+    # Per socket operation like requests' timeout: time spent queueing for a connection does not count
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=180)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        trust_env=True,  # honour HTTP(S)_PROXY like requests
+        headers={"Accept-Encoding": _ACCEPT_ENCODING},
+    ) as session:
+        return await asyncio.gather(*[_analyse_one(session, url, params) for params in params_list])
+
+
+def _analyse_requests(get_session, url, params, stream):
+    session = get_session()  # one session per worker thread: requests.Session is not thread-safe
+    rr = None
+    if _use_post(url, params):
+        rr = session.post(url, data=_analyse_body(params), headers=_JSON_HEADERS, stream=stream, timeout=180)
+        if _post_rejected(rr.status_code):
+            rr.close()
+            _post_unsupported.add(url)
+            rr = None
+    if rr is None:
+        rr = session.get(url, params=params, stream=stream, timeout=180)
+    if rr.status_code != 200:
+        raise _analyse_error(rr.status_code, rr.text)
+    return rr if stream else _json_loads(rr.content)  # streamed responses are parsed (and closed) by the caller
+
+
+def _analyse_h2(client, url, params):
+    try:
+        if _use_post(url, params):
+            r = client.post(url, content=_analyse_body(params), headers=_JSON_HEADERS)
+            if r.status_code == 200:
+                return _json_loads(r.content)
+            if not _post_rejected(r.status_code):
+                raise _analyse_error(r.status_code, r.text)
+            _post_unsupported.add(url)
+
+        for attempt in range(_RETRY_TOTAL + 1):
+            r = client.get(url, params=params)
+            if r.status_code == 200:
+                return _json_loads(r.content)
+            if r.status_code not in _RETRY_STATUSES or attempt == _RETRY_TOTAL:
+                raise _analyse_error(r.status_code, r.text)
+            time.sleep(_retry_delay(attempt, r.headers.get("Retry-After")))
+    except httpx.HTTPError as e:
+        raise _analyse_error(None, str(e) or type(e).__name__) from e
+
+
+def _build_fields(is_point_input):
+    fields = QgsFields()
+    fields.append(QgsField("input_fid", QVariant.LongLong))
+    fields.append(QgsField("input_id", QVariant.String))
+    fields.append(QgsField("dataset", QVariant.String))
+    fields.append(QgsField("timestampId", QVariant.String))
+    fields.append(QgsField("date_from", QVariant.String))
+    fields.append(QgsField("date_to", QVariant.String))
+    fields.append(QgsField("description", QVariant.String))
+    fields.append(QgsField("hasData", QVariant.Int))
+
+    if is_point_input:
+        fields.append(QgsField("pixel_value", QVariant.Double))
+    else:
+        fields.append(QgsField("min", QVariant.Double))
+        fields.append(QgsField("max", QVariant.Double))
+        fields.append(QgsField("mean", QVariant.Double))
+        fields.append(QgsField("median", QVariant.Double))
+        fields.append(QgsField("deviation", QVariant.Double))
+        fields.append(QgsField("sum", QVariant.Double))
+
+    return fields
+
+
+# Output schemas depend only on the input geometry type: build them once, copy per run
+_FIELDS_POINT = _build_fields(True)
+_FIELDS_POLY = _build_fields(False)
+
+
 class VIIRSQuery(QgsProcessingAlgorithm):
 
     P_DATASET = "DATASET"
@@ -41,6 +273,18 @@ class VIIRSQuery(QgsProcessingAlgorithm):
     MAX_SELECTED = 5
     FIRST_YEAR = 2018
     MAX_TIMESTAMPS_PER_REQUEST = 50
+    MAX_CONCURRENT_REQUESTS = 8
+    MAX_STREAMS_AHEAD = 2  # with ijson: streamed responses requested ahead of the one being parsed
+    TIMESTAMPS_CACHE_TTL = 3600  # seconds
+    GEOMETRY_CACHE_MAX_CHARS = 8_000_000  # total GeoJSON kept across runs (~8 MB)
+
+    # Shared across runs: QGIS creates a new algorithm instance for every execution
+    _local = threading.local()  # per-thread requests.Session
+    _h2_client = None
+    _pool = None
+    _timestamps_cache = {}  # dataset_id -> (fetched_at, timestamps)
+    _geometry_cache = {}  # (source CRS, transform context, WKB digest) -> WGS84 GeoJSON
+    _geometry_cache_chars = 0
 
     DATASETS = {
         "LSTD": "5510ddc9-57fb-4014-b751-9da99fa56ae8",
@@ -164,12 +408,8 @@ class VIIRSQuery(QgsProcessingAlgorithm):
 
     @staticmethod
     def _round2(value):
-        if value is None:
-            return None
-        try:
-            return round(float(value), 2)
-        except Exception:
-            return None
+        # JSON numbers already arrive as int/float
+        return None if value is None else round(value, 2)
 
     @staticmethod
     def _yyyymm_from_iso(iso_str):
@@ -187,6 +427,13 @@ class VIIRSQuery(QgsProcessingAlgorithm):
         s = str(iso_str)
         return s[:10] if len(s) >= 10 else s
 
+    @staticmethod
+    def _band1_stats(item):
+        for res in item.get("result") or ():
+            if (res.get("band") or {}).get("number") == 1:
+                return res.get("statistics")
+        return None
+
     @staticmethod
     def _pixel_value_from_statistics(stats):
         if not stats:
@@ -198,6 +445,163 @@ class VIIRSQuery(QgsProcessingAlgorithm):
                 return bin_val
         return stats.get("mean")
 
+    @classmethod
+    def _geometry_json(cls, geom, crs_key, context_key, transform):
+        """WGS84 GeoJSON of a multi-point, line or polygon geometry, curves segmentized, cached by content."""
+        key = (crs_key, context_key, hashlib.blake2b(bytes(geom.asWkb())).digest())
+        cached = cls._geometry_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if QgsWkbTypes.isCurvedType(geom.wkbType()):
+            geom = QgsGeometry(geom.constGet().segmentize())
+        if transform is not None:
+            geom.transform(transform)
+        geometry_param = geom.asJson()
+
+        size = len(geometry_param)
+        if size <= cls.GEOMETRY_CACHE_MAX_CHARS:
+            while cls._geometry_cache and cls._geometry_cache_chars + size > cls.GEOMETRY_CACHE_MAX_CHARS:
+                oldest = next(iter(cls._geometry_cache))
+                cls._geometry_cache_chars -= len(cls._geometry_cache.pop(oldest))
+            cls._geometry_cache[key] = geometry_param
+            cls._geometry_cache_chars += size
+        return geometry_param
+
+    # --------------------------
+    # HTTP
+    # --------------------------
+
+    @classmethod
+    def _http_session(cls):
+        """Keep-alive session of the calling thread, with retry/backoff on transient errors."""
+        session = getattr(cls._local, "session", None)
+        if session is None:
+            retry = Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cls.MAX_CONCURRENT_REQUESTS * 2, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+            cls._local.session = session
+        return session
+
+    @classmethod
+    def _executor(cls):
+        """Worker threads for the httpx/requests transports, kept so their sessions stay warm."""
+        if cls._pool is None:
+            cls._pool = ThreadPoolExecutor(max_workers=cls.MAX_CONCURRENT_REQUESTS)
+        return cls._pool
+
+    @classmethod
+    def _http2_client(cls):
+        """httpx client multiplexing concurrent requests over a single HTTP/2 connection."""
+        if cls._h2_client is None:
+            transport = httpx.HTTPTransport(
+                http2=True,
+                retries=3,  # connection errors only
+                limits=httpx.Limits(
+                    max_keepalive_connections=cls.MAX_CONCURRENT_REQUESTS,
+                    max_connections=cls.MAX_CONCURRENT_REQUESTS * 2,
+                ),
+            )
+            cls._h2_client = httpx.Client(
+                transport=transport, timeout=180, headers={"Accept-Encoding": _ACCEPT_ENCODING}
+            )
+        return cls._h2_client
+
+    @classmethod
+    def _get_timestamps(cls, dataset_id):
+        """Timestamps of a dataset sorted by month, cached for TIMESTAMPS_CACHE_TTL seconds.
+
+        Returns (keys, entries): the YYYYMM key of every timestamp, ascending, and the
+        matching (ts_id, info) pairs, so a period is selected by bisecting keys.
+        """
+        now = time.time()
+        cached = cls._timestamps_cache.get(dataset_id)
+        if cached and now - cached[0] < cls.TIMESTAMPS_CACHE_TTL:
+            return cached[1], cached[2]
+
+        url = f"https://api.ellipsis-drive.com/v3/path/{dataset_id}"
+        r = cls._http_session().get(url, timeout=60)
+        if r.status_code != 200:
+            raise QgsProcessingException(f"Errore nel recupero dei timestamp (HTTP {r.status_code}).")
+
+        data = _json_loads(r.content)
+        timestamps = (data.get("raster") or {}).get("timestamps") or []
+
+        keyed = []
+        for ts in timestamps:
+            ts_id = ts.get("id")
+            if ts_id is None:
+                continue
+
+            date = ts.get("date") or {}
+            date_from = str(date.get("from") or "")
+            key = cls._yyyymm_from_iso(date_from)
+            if key == -1:
+                continue
+
+            keyed.append((key, str(ts_id), {
+                "date_from": cls._date_only(date_from),
+                "date_to": cls._date_only(date.get("to")),
+                "description": ts.get("description") or ""
+            }))
+
+        keyed.sort(key=lambda k: k[0])  # stable: API order kept within a month
+        keys = [k for k, _, _ in keyed]
+        entries = [(ts_id, info) for _, ts_id, info in keyed]
+        cls._timestamps_cache[dataset_id] = (now, keys, entries)
+        return keys, entries
+
+    def _analyse(self, analyse_url, params_list):
+        """Yield the analyse responses (lists of items) in input order.
+
+        Transports, in order of preference: aiohttp (asyncio), httpx over HTTP/2, requests; the
+        last two run the calls on a shared thread pool. With requests and ijson each response is
+        an iterator parsed straight off the socket, with at most MAX_STREAMS_AHEAD more open
+        behind it: consume it before advancing.
+        """
+        if aiohttp is not None:
+            yield from asyncio.run(_analyse_all(analyse_url, params_list, self.MAX_CONCURRENT_REQUESTS))
+            return
+
+        if httpx is not None:
+            client = self._http2_client()
+            stream = False
+            fetch = functools.partial(_analyse_h2, client, analyse_url)
+        else:
+            stream = ijson is not None
+            fetch = functools.partial(_analyse_requests, self._http_session, analyse_url, stream=stream)
+
+        # Workers only do HTTP; results come back in order and the sink is written by the caller.
+        # A streamed response holds its connection until parsed, so only a few are requested ahead.
+        pool = self._executor()
+        todo = iter(params_list)
+        pending = collections.deque(
+            pool.submit(fetch, params)
+            for params in itertools.islice(todo, self.MAX_STREAMS_AHEAD if stream else len(params_list))
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                pending.extend(pool.submit(fetch, params) for params in itertools.islice(todo, 1))
+                if not stream:
+                    yield result
+                    continue
+                with result:
+                    result.raw.decode_content = True  # let urllib3 undo gzip/br
+                    yield ijson.items(result.raw, "item", use_float=True)
+        finally:
+            # Close responses fetched but never consumed (the caller stopped or a job failed)
+            for fut in pending:
+                if not fut.cancel() and stream and fut.exception() is None:
+                    fut.result().close()
+
     # --------------------------
     # Main
     # --------------------------
@@ -239,58 +643,17 @@ class VIIRSQuery(QgsProcessingAlgorithm):
             raise QgsProcessingException("Periodo non valido: la data di inizio è successiva alla data di fine.")
 
         # --- Get timestamps
-        url = f"https://api.ellipsis-drive.com/v3/path/{dataset_id}"
-        r = requests.get(url, timeout=60)
-        if r.status_code != 200:
-            raise QgsProcessingException(f"Errore nel recupero dei timestamp (HTTP {r.status_code}).")
-
-        data = r.json()
-        timestamps = (data.get("raster") or {}).get("timestamps") or []
-
-        ts_info = {}
-        ts_ids = []
+        keys, entries = self._get_timestamps(dataset_id)
+        in_period = entries[bisect.bisect_left(keys, start_key):bisect.bisect_right(keys, end_key)]
 
-        for ts in timestamps:
-            ts_id = ts.get("id")
-            date_from = str((ts.get("date") or {}).get("from") or "")
-            date_to = str((ts.get("date") or {}).get("to") or "")
-
-            key = self._yyyymm_from_iso(date_from)
-            if key == -1 or ts_id is None:
-                continue
-
-            if start_key <= key <= end_key:
-                ts_id = str(ts_id)
-                ts_ids.append(ts_id)
-                ts_info[ts_id] = {
-                    "date_from": self._date_only(date_from),
-                    "date_to": self._date_only(date_to),
-                    "description": ts.get("description") or ""
-                }
+        ts_ids = [ts_id for ts_id, _ in in_period]
+        ts_info = dict(in_period)
 
         if not ts_ids:
             raise QgsProcessingException("Nessun timestamp disponibile nel periodo selezionato.")
 
         # --- Output schema
-        fields = QgsFields()
-        fields.append(QgsField("input_fid", QVariant.LongLong))
-        fields.append(QgsField("input_id", QVariant.String))
-        fields.append(QgsField("dataset", QVariant.String))
-        fields.append(QgsField("timestampId", QVariant.String))
-        fields.append(QgsField("date_from", QVariant.String))
-        fields.append(QgsField("date_to", QVariant.String))
-        fields.append(QgsField("description", QVariant.String))
-        fields.append(QgsField("hasData", QVariant.Int))
-
-        if is_point_input:
-            fields.append(QgsField("pixel_value", QVariant.Double))
-        else:
-            fields.append(QgsField("min", QVariant.Double))
-            fields.append(QgsField("max", QVariant.Double))
-            fields.append(QgsField("mean", QVariant.Double))
-            fields.append(QgsField("median", QVariant.Double))
-            fields.append(QgsField("deviation", QVariant.Double))
-            fields.append(QgsField("sum", QVariant.Double))
+        fields = QgsFields(_FIELDS_POINT if is_point_input else _FIELDS_POLY)
 
         sink, sink_id = self.parameterAsSink(
             parameters,
@@ -304,61 +667,73 @@ class VIIRSQuery(QgsProcessingAlgorithm):
         # --- Analyse with batching
         analyse_url = f"https://api.ellipsis-drive.com/v3/path/{dataset_id}/raster/timestamp/analyse"
         batches = list(self._chunk_list(ts_ids, self.MAX_TIMESTAMPS_PER_REQUEST))
+        batches_json = [_json_dumps(batch) for batch in batches]
 
         # CRS transform once
-        need_transform = (vlayer.crs().authid() != "EPSG:4326")
+        crs_key = vlayer.crs().authid() or vlayer.crs().toWkt()
+        need_transform = (crs_key != "EPSG:4326")
         if need_transform:
-            transform = QgsCoordinateTransform(
-                vlayer.crs(),
-                QgsCoordinateReferenceSystem("EPSG:4326"),
-                QgsProject.instance()
-            )
+            transform_context = context.transformContext()
+            context_key = _transform_context_key(transform_context)
+            transform = _get_transform(crs_key, "EPSG:4326", transform_context, context_key)
         else:
+            context_key = None
             transform = None
 
+        # Geometries first, then all (feature, batch) requests in one go
+        feature_payloads = []
+        points = []  # (payload index, QgsPointXY) of single-point features, reprojected together below
         for f in selected:
 
-            input_fid = f.id()
-            input_id_value = str(f.attribute(id_field)) if id_field else ""
-
-            geom = QgsGeometry(f.geometry())
+            geom = f.geometry()
             if geom.isEmpty():
                 continue
 
-            if transform is not None:
-                geom.transform(transform)
-
-            geometry_param = geom.asJson()  # GeoJSON geometry
+            if is_point_input and not QgsWkbTypes.isMultiType(geom.wkbType()):
+                points.append((len(feature_payloads), geom.asPoint()))
+                geometry_param = None
+            else:
+                geometry_param = self._geometry_json(geom, crs_key, context_key, transform)  # GeoJSON geometry
 
-            for batch in batches:
+            input_id_value = str(f.attribute(id_field)) if id_field else ""
+            feature_payloads.append([f.id(), input_id_value, geometry_param])
 
-                params = {
-                    "timestampIds": json.dumps(batch),
+        if points:
+            coords = [pt for _, pt in points]
+            if transform is not None:
+                # One PROJ call for all points instead of one per feature
+                multi = QgsGeometry.fromMultiPointXY(coords)
+                multi.transform(transform)
+                coords = multi.asMultiPoint()
+            for (i, _), pt in zip(points, coords):
+                feature_payloads[i][2] = f'{{"type":"Point","coordinates":[{pt.x()},{pt.y()}]}}'
+
+        jobs = []
+        params_list = []
+        for input_fid, input_id_value, geometry_param in feature_payloads:
+            for batch_json in batches_json:
+                jobs.append((input_fid, input_id_value))
+                params_list.append({
+                    "timestampIds": batch_json,
                     "geometry": geometry_param,
                     "returnType": "statistics"
-                }
+                })
 
-                rr = requests.get(analyse_url, params=params, timeout=180)
-                if rr.status_code != 200:
-                    raise QgsProcessingException(
-                        f"Errore analyse (HTTP {rr.status_code}): {(rr.text or '')[:200]}"
-                    )
+        round2 = self._round2
+        empty_stats = (None,) * (len(fields) - 8)  # value fields after the 8 common ones
+        rows = []
 
-                analysed = rr.json()
+        responses = self._analyse(analyse_url, params_list)
+        try:
+            for (input_fid, input_id_value), analysed in zip(jobs, responses):
 
                 for item in analysed:
 
                     ts_id = str((item.get("timestamp") or {}).get("id") or "")
                     has_data = 1 if item.get("hasData") else 0
                     info = ts_info.get(ts_id, {})
-                    stats = None
 
-                    for res in item.get("result") or []:
-                        if (res.get("band") or {}).get("number") == 1:
-                            stats = res.get("statistics")
-                            break
-
-                    base_attrs = [
+                    attrs = [
                         input_fid,
                         input_id_value,
                         dataset_name,
@@ -369,21 +744,31 @@ class VIIRSQuery(QgsProcessingAlgorithm):
                         has_data
                     ]
 
-                    out_f = QgsFeature(fields)
+                    # Empty months (gaps/clouds) are common: no band scan, no rounding
+                    stats = self._band1_stats(item) if has_data else None
 
-                    if is_point_input:
-                        val = self._round2(self._pixel_value_from_statistics(stats)) if has_data else None
-                        out_f.setAttributes(base_attrs + [val])
+                    if not stats:
+                        attrs.extend(empty_stats)
+                    elif is_point_input:
+                        attrs.append(round2(self._pixel_value_from_statistics(stats)))
                     else:
-                        out_f.setAttributes(base_attrs + [
-                            self._round2(stats.get("min") if stats else None),
-                            self._round2(stats.get("max") if stats else None),
-                            self._round2(stats.get("mean") if stats else None),
-                            self._round2(stats.get("median") if stats else None),
-                            self._round2(stats.get("deviation") if stats else None),
-                            self._round2(stats.get("sum") if stats else None),
-                        ])
-
-                    sink.addFeature(out_f, QgsFeatureSink.FastInsert)
+                        attrs.extend((
+                            round2(stats.get("min")),
+                            round2(stats.get("max")),
+                            round2(stats.get("mean")),
+                            round2(stats.get("median")),
+                            round2(stats.get("deviation")),
+                            round2(stats.get("sum")),
+                        ))
+
+                    out_f = QgsFeature(fields)
+                    out_f.setAttributes(attrs)
+                    rows.append(out_f)
+
+                # One sink call per response
+                sink.addFeatures(rows, QgsFeatureSink.FastInsert)
+                rows.clear()
+        finally:
+            responses.close()  # releases any open streamed response
 
         return {self.P_OUTPUT: sink_id}